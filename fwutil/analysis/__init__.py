@@ -1 +1,2 @@
 from .data_analysis_interface import IAnalyzer, IDataTransformer, IDataVisualizer
+from .data_layout import ensure_col_major
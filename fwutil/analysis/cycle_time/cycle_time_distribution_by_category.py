@@ -1,9 +1,49 @@
 # File: cycle_time_distribution_by_category.py
 
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
+import pandas as pd
+from scipy.stats import gaussian_kde
 
-from .. import IAnalyzer, IDataTransformer, IDataVisualizer
+from .. import IAnalyzer, IDataTransformer, IDataVisualizer, ensure_col_major
+
+
+def _fast_hist2d(values, codes, n_cats, bins):
+    """
+    Counts values into bins per category with a single np.bincount call.
+
+    Each (category, bin) pair is flattened to one integer index, so the whole 2D histogram is a
+    single vectorized pass instead of one histogram per category. Values are binned exactly as
+    np.histogram bins them: the last bin is closed on the right and values outside the edges are not counted.
+
+    Args:
+        values (np.ndarray): A float64 array of the values to bin.
+        codes (np.ndarray): An integer array of category codes, one per value. Negative codes are skipped.
+        n_cats (int): The number of categories.
+        bins (int): The number of bins, or any bin specification accepted by np.histogram_bin_edges.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: An int64 matrix of shape (n_cats, n_bins) with the count of values
+            per category and bin, and the bin edges.
+
+    Example:
+        counts, edges = _fast_hist2d(values, codes, n_cats=3, bins=30)
+    """
+    valid = np.isfinite(values) & (codes >= 0)
+    values = values[valid]
+    codes = codes[valid].astype(np.int64)
+    edges = np.histogram_bin_edges(values, bins=bins)
+    n_bins = len(edges) - 1
+    # Locating each value among the edges also handles explicit, non-uniform edges
+    bin_idx = np.searchsorted(edges, values, side="right") - 1
+    # The last bin is closed on the right, matching np.histogram
+    bin_idx[values == edges[-1]] = n_bins - 1
+    # Values outside the edges are dropped, so they never spill into another category's row
+    in_range = (bin_idx >= 0) & (bin_idx < n_bins)
+    counts = np.bincount(
+        codes[in_range] * n_bins + bin_idx[in_range], minlength=n_cats * n_bins
+    )
+    return counts.reshape(n_cats, n_bins), edges
 
 
 class CycleTimeDistributionTransformer(IDataTransformer):
@@ -14,12 +54,24 @@ class CycleTimeDistributionTransformer(IDataTransformer):
     Implements the IDataTransformer interface.
     """
 
-    def transform(self, data, **kwargs):
+    CATEGORY_CODE_COL = "_cat_code"
+    CYCLE_TIME_COL = "_ct"
+    CATEGORIES_ATTR = "_categories"
+
+    def transform(self, data, cycle_time_col=None, category_col=None, **kwargs):
         """
         Performs data transformation for the cycle time distribution use case.
 
+        When the column names are given, the category column is factorized once into integer codes
+        (CATEGORY_CODE_COL, with the category labels kept in data.attrs[CATEGORIES_ATTR]) and the cycle
+        time column is materialized as float64 (CYCLE_TIME_COL), so the visualizer does not repeat
+        either conversion on every redraw. Frames whose columns are strided in memory are copied into
+        a column-contiguous layout.
+
         Args:
             data (pd.DataFrame): A DataFrame containing the input data.
+            cycle_time_col (str): The column name representing the cycle time.
+            category_col (str): The column name representing the category.
             **kwargs: Additional keyword arguments for the transformation logic.
 
         Returns:
@@ -27,9 +79,22 @@ class CycleTimeDistributionTransformer(IDataTransformer):
 
         Example:
             transformer = CycleTimeDistributionTransformer()
-            transformed_data = transformer.transform(data)
+            transformed_data = transformer.transform(data, cycle_time_col='cycle_time', category_col='category')
         """
-        return data
+        if cycle_time_col is None or category_col is None:
+            return ensure_col_major(data)
+
+        categorical = pd.Categorical(data[category_col])
+        transformed = data.assign(
+            **{
+                self.CATEGORY_CODE_COL: categorical.codes,
+                self.CYCLE_TIME_COL: data[cycle_time_col].to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                ),
+            }
+        )
+        transformed.attrs[self.CATEGORIES_ATTR] = categorical.categories
+        return ensure_col_major(transformed)
 
 
 class CycleTimeDistributionVisualizer(IDataVisualizer):
@@ -40,14 +105,22 @@ class CycleTimeDistributionVisualizer(IDataVisualizer):
     Implements the IDataVisualizer interface.
     """
 
-    def visualize(self, data, cycle_time_col, category_col):
+    KDE_GRID_SIZE = 200
+    KDE_MAX_SAMPLES = 10000
+
+    def visualize(self, data, cycle_time_col, category_col, bins=30, kde=True):
         """
         Generates a histogram visualization of cycle time distribution by category.
 
+        The histogram is binned in a single vectorized pass and drawn as stacked bars, one layer per category,
+        with an optional kernel density estimate per category fitted on a sample and evaluated on a coarse grid.
+
         Args:
             data (pd.DataFrame): A DataFrame containing the transformed data.
             cycle_time_col (str): The column name representing the cycle time.
             category_col (str): The column name representing the category.
+            bins (int): The number of histogram bins shared by all categories.
+            kde (bool): Whether to overlay a stacked kernel density estimate for each category.
 
         Returns:
             None
@@ -56,9 +129,56 @@ class CycleTimeDistributionVisualizer(IDataVisualizer):
             visualizer = CycleTimeDistributionVisualizer()
             visualizer.visualize(data, cycle_time_col='cycle_time', category_col='category')
         """
-        sns.histplot(
-            data=data, x=cycle_time_col, hue=category_col, kde=True, multiple="stack"
-        )
+        transformer = CycleTimeDistributionTransformer
+        if (
+            transformer.CATEGORY_CODE_COL in data
+            and transformer.CATEGORIES_ATTR in data.attrs
+        ):
+            # Reuse the codes and values precomputed by CycleTimeDistributionTransformer
+            values = data[transformer.CYCLE_TIME_COL].to_numpy()
+            codes = data[transformer.CATEGORY_CODE_COL].to_numpy()
+            categories = data.attrs[transformer.CATEGORIES_ATTR]
+        else:
+            values = data[cycle_time_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            categorical = pd.Categorical(data[category_col])
+            codes = categorical.codes
+            categories = categorical.categories
+        counts, edges = _fast_hist2d(values, codes, len(categories), bins)
+        widths = np.diff(edges)
+        finite = np.isfinite(values)
+        grid = np.linspace(edges[0], edges[-1], self.KDE_GRID_SIZE)
+
+        bar_bottom = np.zeros(len(widths))
+        kde_bottom = np.zeros(len(grid))
+        rng = np.random.default_rng(0)
+        for i, category in enumerate(categories):
+            if not counts[i].any():
+                continue
+            color = f"C{i}"
+            plt.bar(
+                edges[:-1],
+                counts[i],
+                width=widths,
+                bottom=bar_bottom,
+                align="edge",
+                color=color,
+                alpha=0.75,
+                label=str(category),
+            )
+            bar_bottom += counts[i]
+
+            group_values = values[finite & (codes == i)]
+            if kde and len(group_values) > 1 and np.ptp(group_values) > 0:
+                # The KDE costs O(samples * grid points), so fit it on a fixed-size sample
+                sample = group_values
+                if len(sample) > self.KDE_MAX_SAMPLES:
+                    sample = rng.choice(sample, self.KDE_MAX_SAMPLES, replace=False)
+                # Scale the density to counts so it lines up with the bars
+                density = gaussian_kde(sample)(grid)
+                kde_bottom += density * len(group_values) * widths[0]
+                plt.plot(grid, kde_bottom, color=color)
+
+        plt.legend(title=category_col)
         plt.title("Cycle Time Distribution by Category")
         plt.xlabel("Cycle Time (Days)")
         plt.ylabel("Frequency")
@@ -96,7 +216,9 @@ class CycleTimeDistributionAnalyzer(IAnalyzer):
             analyzer = CycleTimeDistributionAnalyzer(transformer, visualizer)
             analyzer.analyze(data, cycle_time_col='cycle_time', category_col='category')
         """
-        transformed_data = self.transformer.transform(data)
+        transformed_data = self.transformer.transform(
+            data, cycle_time_col=cycle_time_col, category_col=category_col
+        )
         self.visualizer.visualize(
             transformed_data, cycle_time_col=cycle_time_col, category_col=category_col
         )
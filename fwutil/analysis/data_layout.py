@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+
+def ensure_col_major(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ensures every column of the DataFrame is stored contiguously in memory.
+
+    A DataFrame built from a row-major 2D array keeps that array as its backing block, so each
+    column is a strided view and column-wise reductions skip through memory. Such frames are
+    copied once into a column-contiguous layout; frames that are already laid out by column are
+    returned unchanged.
+
+    Args:
+        data (pd.DataFrame): A DataFrame containing the input data.
+
+    Returns:
+        pd.DataFrame: A DataFrame whose columns are contiguous in memory.
+
+    Example:
+        data = ensure_col_major(pd.DataFrame(np.random.rand(1000, 4)))
+    """
+    # Blocks are stored as (columns, rows), so a C-contiguous block has contiguous columns
+    for block in data._mgr.blocks:
+        if isinstance(block.values, np.ndarray) and not block.values.flags.c_contiguous:
+            return data.copy()
+    return data
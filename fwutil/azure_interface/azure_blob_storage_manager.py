@@ -1,22 +1,37 @@
 import logging
+import mmap
 import os
+import threading
 import time
+from collections import OrderedDict
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import azure_interface as AzureInterface
 import pandas as pd
+import pyarrow as pa
 import utils as Utils
 from azure.core.exceptions import ResourceNotFoundError
-from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob import (
+    BlobClient,
+    BlobProperties,
+    BlobServiceClient,
+    ContainerClient,
+    StorageErrorCode,
+)
+
+# Objects supporting the buffer protocol that upload_blob sends without copying
+BytesLike = Union[bytes, bytearray, memoryview, pa.Buffer]
 
 
 class AzureBlobStorageManager:
     """
     A class that manages interactions with Azure Blob Storage.
 
-    This class provides methods for uploading, downloading, and deleting blobs. It also initializes a dictionary of
-    ContainerClients for each container in the storage account upon instantiation.
+    This class provides methods for uploading, downloading, and deleting blobs. The BlobServiceClient and the
+    ContainerClient for each container are created on first use rather than upon instantiation.
 
     Attributes:
         logger (logging.Logger): The logger to be used.
@@ -30,6 +45,18 @@ class AzureBlobStorageManager:
 
     logger: logging.Logger
 
+    # Upper bound on the number of requests made against the storage account at the same time
+    MAX_CONCURRENT_REQUESTS: int = 32
+
+    # Number of blocks uploaded in parallel for a single large blob
+    MAX_UPLOAD_CONCURRENCY: int = 8
+
+    # Maximum number of sub-requests Azure accepts in a single batch request
+    MAX_DELETE_BATCH_SIZE: int = 256
+
+    # Number of recently used BlobClients kept for reuse
+    BLOB_CLIENT_CACHE_SIZE: int = 1024
+
     def __init__(self) -> None:
         """
         Initialize the AzureBlobStorageManager and read environment variables.
@@ -43,51 +70,111 @@ class AzureBlobStorageManager:
         self.storage_account_name: str = os.getenv("STORAGE_ACCOUNT_NAME")
         self.endpoint_suffix: str = os.getenv("AZURE_ENDPOINT_SUFFIX")
 
-        # Log the names of environment variables loaded
-        self.logger.info(f"Loaded STORAGE_ACCOUNT_KEY: {self.storage_account_key}")
-        self.logger.info(f"Loaded STORAGE_ACCOUNT_NAME: {self.storage_account_name}")
-        self.logger.info(f"Loaded STORAGE_ACCOUNT_NAME: {self.endpoint_suffix}")
+        # Log the names of environment variables loaded. The account key is a secret, so only
+        # whether it was found is logged, never its value
+        self.logger.info(
+            "Loaded STORAGE_ACCOUNT_KEY: %s",
+            "<set>" if self.storage_account_key else "<not set>",
+        )
+        self.logger.info("Loaded STORAGE_ACCOUNT_NAME: %s", self.storage_account_name)
+        self.logger.info("Loaded AZURE_ENDPOINT_SUFFIX: %s", self.endpoint_suffix)
 
         self.connection_string: str = self.build_connection_string()
 
-        # Log the connection string
-        self.logger.info(f"Built connection string: {self.connection_string}")
+        # The connection string embeds the account key, so it is not logged
+        self.logger.info(
+            "Built connection string for storage account: %s",
+            self.storage_account_name,
+        )
+
+        # The BlobServiceClient, container names and ContainerClients are created on first use
+        self._container_clients: Dict[str, ContainerClient] = {}
 
-        # Initialize BlobServiceClient
+        # Recently used BlobClients keyed by (container name, blob name), least recently used first
+        self._blob_clients: "OrderedDict[Tuple[str, str], BlobClient]" = OrderedDict()
+        self._blob_clients_lock = threading.Lock()
+
+        self.logger.info("AzureBlobStorageManager initialized successfully.")
+
+    @cached_property
+    def blob_service_client(self) -> BlobServiceClient:
+        """
+        The BlobServiceClient used to interact with Azure Blob Storage, created on first access.
+        """
         try:
-            self.blob_service_client: BlobServiceClient = (
-                BlobServiceClient.from_connection_string(self.connection_string)
+            blob_service_client = BlobServiceClient.from_connection_string(
+                self.connection_string
             )
             self.logger.info("BlobServiceClient initialized successfully.")
+            return blob_service_client
         except Exception as e:
-            self.logger.error(f"Failed to initialize BlobServiceClient: {str(e)}")
+            self.logger.error("Failed to initialize BlobServiceClient: %s", e)
             raise
 
-        # Dynamically pull the list of container names from the storage account
+    @cached_property
+    def container_names(self) -> List[str]:
+        """
+        The names of the containers in the storage account, retrieved on first access.
+        """
         try:
-            self.container_names: List[str] = [
+            container_names = [
                 container.name
                 for container in self.blob_service_client.list_containers()
             ]
-            self.logger.info(f"Retrieved container names: {self.container_names}")
+            self.logger.info("Retrieved container names: %s", container_names)
+            return container_names
         except Exception as e:
-            self.logger.error(f"Failed to retrieve container names: {str(e)}")
+            self.logger.error("Failed to retrieve container names: %s", e)
             raise
 
-        # Initialize a dictionary of ContainerClients for the specified containers
-        try:
-            self.container_clients = {
-                container_name: self.blob_service_client.get_container_client(
-                    container_name
-                )
-                for container_name in self.container_names
-            }
-            self.logger.info("ContainerClients initialized successfully.")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize ContainerClients: {str(e)}")
-            raise
+    @property
+    def container_clients(self) -> Dict[str, ContainerClient]:
+        """
+        A dictionary where keys are container names and values are the corresponding ContainerClients.
+        """
+        return {
+            container_name: self._container(container_name)
+            for container_name in self.container_names
+        }
 
-        self.logger.info("AzureBlobStorageManager initialized successfully.")
+    def _container(self, container_name: str) -> ContainerClient:
+        """
+        Get the ContainerClient for a container, creating it on first use.
+
+        Creating the client makes no request, so the container is not checked up front. Requests
+        against a container that does not exist raise ResourceNotFoundError instead.
+
+        Args:
+            container_name (str): The name of the container.
+
+        Returns:
+            ContainerClient: The client for the container.
+        """
+        container_client = self._container_clients.get(container_name)
+        if container_client is None:
+            container_client = self._container_clients.setdefault(
+                container_name,
+                self.blob_service_client.get_container_client(container_name),
+            )
+        return container_client
+
+    def _container_not_found(
+        self, ex: ResourceNotFoundError, container_name: str
+    ) -> bool:
+        """
+        Check whether a ResourceNotFoundError was raised because the container does not exist, logging it if so.
+
+        Args:
+            ex (ResourceNotFoundError): The error raised by a request against the container.
+            container_name (str): The name of the container.
+
+        Returns:
+            bool: True if the container does not exist, False if the error is about another resource, such as a blob.
+        """
+        if ex.error_code != StorageErrorCode.CONTAINER_NOT_FOUND:
+            return False
+        self.logger.error("Container '%s' not found", container_name)
+        return True
 
     def build_connection_string(self) -> str:
         """
@@ -99,67 +186,107 @@ class AzureBlobStorageManager:
         conn_string = f"DefaultEndpointsProtocol=https;AccountName={self.storage_account_name};AccountKey={self.storage_account_key}==;EndpointSuffix={self.endpoint_suffix}"
         return conn_string
 
+    def _blob_client(self, container_name: str, blob_name: str) -> BlobClient:
+        """
+        Get a BlobClient for a blob, reusing a cached client when the blob was accessed recently.
+
+        Args:
+            container_name (str): The name of the container where the blob is located.
+            blob_name (str): The name of the blob.
+
+        Returns:
+            BlobClient: The client for the blob.
+        """
+        key = (container_name, blob_name)
+        with self._blob_clients_lock:
+            blob_client = self._blob_clients.get(key)
+            if blob_client is not None:
+                self._blob_clients.move_to_end(key)
+                return blob_client
+
+            blob_client = self._container(container_name).get_blob_client(blob_name)
+            self._blob_clients[key] = blob_client
+            if len(self._blob_clients) > self.BLOB_CLIENT_CACHE_SIZE:
+                self._blob_clients.popitem(last=False)
+            return blob_client
+
     def upload_blob(
-        self, container_name: str, blob_name: str, file_data: Union[str, BytesIO]
+        self,
+        container_name: str,
+        blob_name: str,
+        file_data: Union[str, BytesIO, BytesLike],
     ) -> None:
         """
         Uploads data to a blob in a specified container.
 
-        This function supports uploading data either from a file path or a BytesIO object.
+        This function supports uploading data from a file path, a BytesIO object, or a bytes-like object.
 
         Args:
             container_name (str): The name of the container where the blob will be uploaded.
             blob_name (str): The name of the blob to upload the data to.
-            file_data (Union[str, BytesIO]): The data to be uploaded. If a string is provided,
-                                            it is assumed to be a file path. If a BytesIO object is provided,
+            file_data (Union[str, BytesIO, BytesLike]): The data to be uploaded. If a string is provided,
+                                            it is assumed to be a file path. If a BytesIO object or a bytes-like
+                                            object (such as bytes, a memoryview or a pyarrow Buffer) is provided,
                                             the data is uploaded directly.
         """
         upload_response = None  # Initialize upload_response
-        container_client = self.container_clients.get(container_name)
         self.logger.info(
-            f"Uploading data to blob '{blob_name}' in container '{container_name}'"
+            "Uploading data to blob '%s' in container '%s'", blob_name, container_name
         )
-        if container_client:
-            try:
-                if isinstance(file_data, str):
-                    self.logger.info(
-                        f"Detected file data as string, attempting to open file at path: {file_data}"
-                    )
-                    with open(file_data, "rb") as file:
-                        upload_response = container_client.upload_blob(
-                            name=blob_name, data=file, overwrite=True
-                        )
-                elif isinstance(file_data, BytesIO):
-                    self.logger.info(
-                        f"Detected file data as BytesIO, uploading directly."
-                    )
-                    upload_response = container_client.upload_blob(
-                        name=blob_name, data=file_data.getvalue(), overwrite=True
-                    )
-                else:
-                    self.logger.error(
-                        f"Unsupported data type for file_data: {type(file_data).__name__}"
-                    )
-                    return
-
-                self.logger.info(f"Finished uploading data to blob '{blob_name}'")
-                # Check if the blob was successfully uploaded
-                blob_client = container_client.get_blob_client(blob_name)
-                if blob_client.exists():
-                    self.logger.info(
-                        f"Successfully uploaded data to blob '{blob_name}'"
-                    )
-                else:
-                    self.logger.error(
-                        f"Failed to upload data to blob '{blob_name}', blob does not exist after upload attempt."
-                    )
-            except Exception as ex:
+        try:
+            # BlobClient.upload_blob returns the blob's etag and last modified time,
+            # which confirm the upload without a separate existence check
+            blob_client = self._blob_client(container_name, blob_name)
+            if isinstance(file_data, str):
+                self.logger.info(
+                    "Detected file data as string, attempting to open file at path: %s",
+                    file_data,
+                )
+                with open(file_data, "rb") as file:
+                    upload_response = blob_client.upload_blob(file, overwrite=True)
+            elif isinstance(file_data, BytesIO):
+                self.logger.info("Detected file data as BytesIO, uploading directly.")
+                # Stream the buffer itself rather than a getvalue() copy of it, letting
+                # the SDK upload large payloads as parallel blocks
+                file_data.seek(0)
+                upload_response = blob_client.upload_blob(
+                    file_data,
+                    length=file_data.getbuffer().nbytes,
+                    overwrite=True,
+                    max_concurrency=self.MAX_UPLOAD_CONCURRENCY,
+                )
+            elif isinstance(file_data, (bytes, bytearray, memoryview, pa.Buffer)):
+                self.logger.info(
+                    "Detected file data as bytes-like, uploading directly."
+                )
+                # Read the buffer through a zero-copy pyarrow reader rather than copying it into a BytesIO
+                upload_response = blob_client.upload_blob(
+                    pa.BufferReader(file_data),
+                    length=memoryview(file_data).nbytes,
+                    overwrite=True,
+                    max_concurrency=self.MAX_UPLOAD_CONCURRENCY,
+                )
+            else:
                 self.logger.error(
-                    f"Failed to upload data to blob '{blob_name}' - Type: {type(ex).__name__}, Message: {str(ex)}"
+                    "Unsupported data type for file_data: %s",
+                    type(file_data).__name__,
                 )
-                self.logger.error(f"Upload response: {upload_response}")
-        else:
-            self.logger.error(f"Container '{container_name}' not found")
+                return
+
+            self.logger.info(
+                "Successfully uploaded data to blob '%s' - ETag: %s, Last modified: %s",
+                blob_name,
+                upload_response["etag"],
+                upload_response["last_modified"],
+            )
+        except Exception as ex:
+            self.logger.error(
+                "Failed to upload data to blob '%s' - Type: %s, Message: %s",
+                blob_name,
+                type(ex).__name__,
+                ex,
+            )
+            self.logger.error("Upload response: %s", upload_response)
 
     def download_blob(
         self, container_name: str, blob_name: str, download_path: str
@@ -172,18 +299,41 @@ class AzureBlobStorageManager:
             blob_name (str): The name of the blob to download the data from.
             download_path (str): The file path where the downloaded data will be stored.
         """
-        container_client = self.container_clients.get(container_name)
-        if container_client:
-            self.logger.info(f'Downloading blob "{blob_name}" to "{download_path}"')
-            blob_client = container_client.get_blob_client(blob_name)
-            with open(download_path, "wb") as file:
-                blob_data = blob_client.download_blob()
-                blob_data.readinto(file)
-            self.logger.info(
-                f'Successfully downloaded blob "{blob_name}" to "{download_path}"'
-            )
-        else:
-            self.logger.error(f"Container '{container_name}' not found")
+        self.logger.info('Downloading blob "%s" to "%s"', blob_name, download_path)
+        blob_client = self._blob_client(container_name, blob_name)
+        try:
+            # Start the download before opening the file, so a missing container leaves no empty file behind
+            blob_data = blob_client.download_blob()
+        except ResourceNotFoundError as ex:
+            if not self._container_not_found(ex, container_name):
+                raise
+            return
+        with open(download_path, "wb") as file:
+            blob_data.readinto(file)
+        self.logger.info(
+            'Successfully downloaded blob "%s" to "%s"', blob_name, download_path
+        )
+
+    def download_blob_to_mmap(self, container_name: str, blob_name: str) -> mmap.mmap:
+        """
+        Downloads a blob to a temporary file and memory-maps it.
+
+        The OS page cache serves reads from the mapping, so large blobs can be scanned without holding
+        a copy of their content in the process heap.
+
+        Args:
+            container_name (str): The name of the container where the blob is located.
+            blob_name (str): The name of the blob to download.
+
+        Raises:
+            ResourceNotFoundError: If the container or the blob does not exist.
+
+        Returns:
+            mmap.mmap: A read-only memory map of the blob content.
+        """
+        self.logger.info('Memory-mapping blob "%s"', blob_name)
+        blob_data = self._blob_client(container_name, blob_name).download_blob()
+        return AzureInterface.BlobDataLoader.map_blob_content(blob_data)
 
     def delete_blob(self, container_name: str, blob_name: str) -> None:
         """
@@ -193,13 +343,45 @@ class AzureBlobStorageManager:
             container_name (str): The name of the container where the blob is located.
             blob_name (str): The name of the blob to be deleted.
         """
-        container_client = self.container_clients.get(container_name)
-        if container_client:
-            self.logger.info(f'Deleting blob "{blob_name}"')
+        container_client = self._container(container_name)
+        self.logger.info('Deleting blob "%s"', blob_name)
+        try:
             container_client.delete_blob(blob_name)
-            self.logger.info(f'Successfully deleted blob "{blob_name}"')
-        else:
-            self.logger.error(f"Container '{container_name}' not found")
+        except ResourceNotFoundError as ex:
+            if not self._container_not_found(ex, container_name):
+                raise
+            return
+        self.logger.info('Successfully deleted blob "%s"', blob_name)
+
+    def delete_blobs(self, container_name: str, blob_names: List[str]) -> None:
+        """
+        Deletes several blobs from a specified container using batch requests.
+
+        Blobs are deleted in batches of up to MAX_DELETE_BATCH_SIZE, the most a single Azure batch request accepts.
+
+        Args:
+            container_name (str): The name of the container where the blobs are located.
+            blob_names (List[str]): The names of the blobs to be deleted.
+        """
+        container_client = self._container(container_name)
+        self.logger.info(
+            'Deleting %s blob(s) from container "%s"',
+            len(blob_names),
+            container_name,
+        )
+        try:
+            for start in range(0, len(blob_names), self.MAX_DELETE_BATCH_SIZE):
+                batch = blob_names[start : start + self.MAX_DELETE_BATCH_SIZE]
+                container_client.delete_blobs(*batch)
+        except ResourceNotFoundError as ex:
+            if not self._container_not_found(ex, container_name):
+                raise
+            return
+        self.logger.info(
+            'Successfully deleted %s blob(s) from container "%s"',
+            len(blob_names),
+            container_name,
+        )
 
     def list_blobs(self, container_name: str) -> List[str]:
         """
@@ -210,17 +392,18 @@ class AzureBlobStorageManager:
         Returns:
             List[str]: A list of blob names in the container.
         """
-        container_client = self.container_clients.get(container_name)
-        if container_client:
-            self.logger.info(f'Listing blobs in container "{container_name}"')
+        container_client = self._container(container_name)
+        self.logger.info('Listing blobs in container "%s"', container_name)
+        try:
             blobs = [blob.name for blob in container_client.list_blobs()]
-            self.logger.info(
-                f'Found {len(blobs)} blob(s) in container "{container_name}"'
-            )
-            return blobs
-        else:
-            self.logger.error(f'Container "{container_name}" not found')
+        except ResourceNotFoundError as ex:
+            if not self._container_not_found(ex, container_name):
+                raise
             return []
+        self.logger.info(
+            'Found %s blob(s) in container "%s"', len(blobs), container_name
+        )
+        return blobs
 
     def list_containers(self) -> List[str]:
         """
@@ -234,51 +417,86 @@ class AzureBlobStorageManager:
     def log_container_info(self) -> None:
         """
         Log information about each container in the storage account for data discovery.
+
+        Containers are listed concurrently, since each listing is an independent chain of requests.
         """
-        # Iterate through each container in the storage account
-        for container_name in self.container_names:
-            try:
-                container_client = self.container_clients[container_name]
-                blobs = list(container_client.list_blobs())
-                num_blobs = len(blobs)
-                total_size = sum(blob.size for blob in blobs)
-                last_modified_times = [blob.last_modified for blob in blobs]
-                earliest_modified_time = (
-                    min(last_modified_times) if last_modified_times else None
-                )
-                latest_modified_time = (
-                    max(last_modified_times) if last_modified_times else None
-                )
+        if not self.container_names:
+            return
+        max_workers = min(len(self.container_names), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so every container has been logged before returning
+            list(executor.map(self._log_container_summary, self.container_names))
+
+    def _log_container_summary(self, container_name: str) -> None:
+        """
+        Log information about a single container and the blobs within it.
 
-                # Log container information
-                self.logger.info(f"Container name: {container_name}")
-                self.logger.info(f"Number of blobs: {num_blobs}")
-                self.logger.info(f"Total size of blobs (bytes): {total_size}")
-                self.logger.info(
-                    f"Earliest blob modification time: {earliest_modified_time}"
-                )
-                self.logger.info(
-                    f"Latest blob modification time: {latest_modified_time}"
-                )
+        The blob listing is consumed in a single pass, so memory use does not grow with the number of blobs.
+        Containers are summarized on parallel threads, so every record names its container: one record for
+        each blob, followed by one record with the container's totals, which are only known after the pass.
+
+        Args:
+            container_name (str): The name of the container to log information about.
+        """
+        try:
+            container_client = self._container(container_name)
+            num_blobs = 0
+            total_size = 0
+            earliest_modified_time = None
+            latest_modified_time = None
+            log_blobs = self.logger.isEnabledFor(logging.INFO)
+
+            self.logger.info("Listing container: %s", container_name)
+
+            # Log information about each blob within the container
+            for blob in container_client.list_blobs():
+                num_blobs += 1
+                total_size += blob.size
+                if earliest_modified_time is None:
+                    earliest_modified_time = latest_modified_time = blob.last_modified
+                else:
+                    earliest_modified_time = min(
+                        earliest_modified_time, blob.last_modified
+                    )
+                    latest_modified_time = max(latest_modified_time, blob.last_modified)
 
-                # Log information about each blob within the container
-                for blob in blobs:
-                    self.logger.info(f"  Blob name: {blob.name}")
-                    self.logger.info(f"  Blob size (bytes): {blob.size}")
+                # Skip the per-blob records entirely when INFO is filtered out
+                if log_blobs:
                     self.logger.info(
-                        f"  Blob content type: {blob.content_settings.content_type}"
+                        "  Blob: %s/%s - Size (bytes): %s, Content type: %s, Last modified: %s",
+                        container_name,
+                        blob.name,
+                        blob.size,
+                        blob.content_settings.content_type,
+                        blob.last_modified,
                     )
-                    self.logger.info(f"  Blob last modified: {blob.last_modified}")
 
-            except ResourceNotFoundError:
-                self.logger.error(f"Container '{container_name}' not found")
-            except Exception as ex:
-                self.logger.error(
-                    f"Failed to retrieve information for container '{container_name}' - {str(ex)}"
-                )
+            # Log container information
+            self.logger.info(
+                "Container: %s - Number of blobs: %s, Total size of blobs (bytes): %s, "
+                "Earliest blob modification time: %s, Latest blob modification time: %s",
+                container_name,
+                num_blobs,
+                total_size,
+                earliest_modified_time,
+                latest_modified_time,
+            )
+
+        except ResourceNotFoundError:
+            self.logger.error("Container '%s' not found", container_name)
+        except Exception as ex:
+            self.logger.error(
+                "Failed to retrieve information for container '%s' - %s",
+                container_name,
+                ex,
+            )
 
     def load_blob_to_dataframe(
-        self, container_name: str, blob_name: str
+        self,
+        container_name: str,
+        blob_name: str,
+        columns: Optional[List[str]] = None,
+        content_type: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Load a single blob to a pandas DataFrame.
@@ -286,31 +504,33 @@ class AzureBlobStorageManager:
         Args:
             container_name (str): The name of the container where the blob is located.
             blob_name (str): The name of the blob to load.
+            columns (Optional[List[str]]): The columns to read from a Parquet blob. If None, all columns are read.
+            content_type (Optional[str]): The content type of the blob, if already known from a blob listing.
+                                          If None, it is read from the properties returned with the download.
 
         Returns:
             pd.DataFrame: A DataFrame containing the data from the blob.
                         If an error occurs, it logs the error and returns None.
         """
-        container_client = self.container_clients.get(container_name)
-        if container_client:
-            try:
-                blob_client = container_client.get_blob_client(blob_name)
-                content_type = (
-                    blob_client.get_blob_properties().content_settings.content_type
-                )
-                blob_data = AzureInterface.BlobDataLoader.load_blob_content(
-                    container_client, blob_name
-                )
-                return AzureInterface.BlobDataLoader.load_blob_to_dataframe(
-                    blob_data, content_type
-                )
-            except Exception as ex:
-                self.logger.error(
-                    f"Failed to load blob '{blob_name}' from container '{container_name}' - {str(ex)}"
-                )
+        container_client = self._container(container_name)
+        try:
+            blob_data = AzureInterface.BlobDataLoader.load_blob_content(
+                container_client, blob_name
+            )
+            if blob_data is None:
                 return None
-        else:
-            self.logger.error(f"Container '{container_name}' not found")
+            if content_type is None:
+                content_type = blob_data.properties.content_settings.content_type
+            return AzureInterface.BlobDataLoader.load_blob_to_dataframe(
+                blob_data, content_type, columns=columns
+            )
+        except Exception as ex:
+            self.logger.error(
+                "Failed to load blob '%s' from container '%s' - %s",
+                blob_name,
+                container_name,
+                ex,
+            )
             return None
 
     def load_blob_sheet_to_dataframe(
@@ -325,21 +545,20 @@ class AzureBlobStorageManager:
             sheet_name (str): The name of the sheet to load from the Excel file. If None, loads the first sheet.
 
         Raises:
-            ValueError: If the container does not exist or if the blob's content type is not an Excel content type.
-            Exception: If any other error occurs during the loading process.
+            ValueError: If the blob's content type is not an Excel content type.
+            Exception: If the blob cannot be downloaded, for instance because the container does not exist,
+                       or if any other error occurs during the loading process.
 
         Returns:
             pd.DataFrame: A DataFrame containing the data from the blob's sheet.
         """
-        container_client = self.container_clients.get(container_name)
-        if container_client is None:
-            raise ValueError(f"Container '{container_name}' not found")
-
-        blob_client = container_client.get_blob_client(blob_name)
-        content_type = blob_client.get_blob_properties().content_settings.content_type
+        container_client = self._container(container_name)
         blob_data = AzureInterface.BlobDataLoader.load_blob_content(
             container_client, blob_name
         )
+        if blob_data is None:
+            raise Exception(f"Failed to download blob '{blob_name}'")
+        content_type = blob_data.properties.content_settings.content_type
 
         if content_type not in [
             "application/vnd.ms-excel",
@@ -350,20 +569,30 @@ class AzureBlobStorageManager:
             )
 
         try:
-            with BytesIO(blob_data) as data:
-                df = pd.read_excel(data, sheet_name=sheet_name)
+            with AzureInterface.BlobDataLoader.spool_blob_content(blob_data) as data:
+                df = pd.read_excel(
+                    data,
+                    sheet_name=sheet_name,
+                    dtype_backend=AzureInterface.blob_data_loader.DTYPE_BACKEND,
+                )
                 return df
         except Exception as ex:
             raise Exception(
                 f"Failed to load blob '{blob_name}' into a DataFrame"
             ) from ex
 
-    def load_blobs_to_dataframes(self, container_name: str) -> Dict[str, pd.DataFrame]:
+    def load_blobs_to_dataframes(
+        self, container_name: str, max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> Dict[str, pd.DataFrame]:
         """
         Load all blobs from a container to pandas DataFrames.
 
+        Blobs are downloaded and parsed concurrently on a thread pool, since the work is dominated
+        by network latency rather than CPU.
+
         Args:
             container_name (str): The name of the container where the blobs are located.
+            max_workers (int): The maximum number of blobs to download at the same time.
 
         Returns:
             Dict[str, pd.DataFrame]: A dictionary where keys are blob names, and values are
@@ -372,17 +601,33 @@ class AzureBlobStorageManager:
                                     it logs the error and excludes the blob from the returned dictionary.
         """
         dataframes = {}
-        container_client = self.container_clients.get(container_name)
-        if container_client:
-            blobs = container_client.list_blobs()
-            for blob in blobs:
-                self.logger.info(
-                    f"Loading blob '{blob.name}' from container '{container_name}'"
-                )
-                df = self.load_blob_to_dataframe(container_name, blob.name)
+        container_client = self._container(container_name)
+        # The listing already carries each blob's content settings, so pass the content type
+        # through rather than fetching the blob properties again for every blob
+        try:
+            blobs = list(container_client.list_blobs())
+        except ResourceNotFoundError as ex:
+            if not self._container_not_found(ex, container_name):
+                raise
+            return {}
+        self.logger.info(
+            "Loading %s blob(s) from container '%s'", len(blobs), container_name
+        )
+
+        def load_blob(blob: BlobProperties) -> pd.DataFrame:
+            return self.load_blob_to_dataframe(
+                container_name,
+                blob.name,
+                content_type=blob.content_settings.content_type,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for blob, df in zip(blobs, executor.map(load_blob, blobs)):
                 if df is not None:
                     self.logger.info(
-                        f"Successfully loaded blob '{blob.name}' from container '{container_name}'"
+                        "Successfully loaded blob '%s' from container '%s'",
+                        blob.name,
+                        container_name,
                     )
                     if isinstance(df, dict):
                         for sheet_name, sheet_df in df.items():
@@ -391,9 +636,8 @@ class AzureBlobStorageManager:
                         dataframes[blob.name] = df
                 else:
                     self.logger.error(
-                        f"Failed to load blob '{blob.name}' from container '{container_name}'"
+                        "Failed to load blob '%s' from container '%s'",
+                        blob.name,
+                        container_name,
                     )
-            return dataframes
-        else:
-            self.logger.error(f"Container '{container_name}' not found")
-            return {}
+        return dataframes
@@ -1,12 +1,40 @@
 import logging
-from io import BytesIO
-from typing import Dict, Optional, Union
+import mmap
+from functools import partial
+from tempfile import SpooledTemporaryFile, TemporaryFile
+from typing import BinaryIO, Callable, Dict, List, Optional, Union
 
 import pandas as pd
-from azure.storage.blob import BlobProperties, ContainerClient
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from azure.storage.blob import BlobProperties, ContainerClient, StorageStreamDownloader
 
 logger = logging.getLogger(__name__)
 
+# Blobs up to this size are buffered in memory before parsing, larger ones spill to disk
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Size of the chunks pyarrow's CSV reader parses in parallel
+CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+CONTENT_TYPE_MAPPING: Dict[str, str] = {
+    "text/csv": "read_csv",
+    "application/json": "read_json",
+    "application/vnd.ms-excel": "read_excel",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "read_excel",
+    "application/octet-stream": "read_parquet",
+    "text/html": "read_html",
+    "text/xml": "read_xml",
+}
+
+# Columns are returned as Arrow-backed extension arrays (pd.ArrowDtype) rather than NumPy and object
+# arrays, so Arrow tables convert without copying and strings are not boxed into Python objects
+DTYPE_BACKEND = "pyarrow"
+
+# A single DataFrame, or one DataFrame per sheet for Excel workbooks
+BlobContent = Union[pd.DataFrame, Dict[str, pd.DataFrame]]
+
 
 class BlobDataLoader:
     """
@@ -24,67 +52,190 @@ class BlobDataLoader:
         Returns:
             str: The name of the pandas loading function to use.
         """
-        content_type_mapping = {
-            "text/csv": "read_csv",
-            "application/json": "read_json",
-            "application/vnd.ms-excel": "read_excel",
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "read_excel",
-            "application/octet-stream": "read_parquet",
-            "text/html": "read_html",
-            "text/xml": "read_xml",
-        }
-        return content_type_mapping.get(content_type)
+        return CONTENT_TYPE_MAPPING.get(content_type)
 
     @staticmethod
     def load_blob_to_dataframe(
-        blob_data: bytes, content_type: str
+        blob_data: StorageStreamDownloader,
+        content_type: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List] = None,
     ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """
         Loads the content of a blob into a pandas DataFrame.
 
         Args:
-            blob_data (bytes): The data from the blob.
+            blob_data (StorageStreamDownloader): The download stream of the blob.
             content_type (str): The content type of the blob.
+            columns (Optional[List[str]]): The columns to read from a Parquet blob. If None, all columns are read.
+            filters (Optional[List]): Row filters applied while reading a Parquet blob, in pyarrow's DNF format.
 
         Returns:
             Union[pd.DataFrame, Dict[str, pd.DataFrame]]: The blob data loaded into a DataFrame. If the blob contains multiple sheets (as in an Excel file), returns a dictionary where keys are sheet names and values are DataFrames.
         """
+        # The reader for each content type is bound once at import time (see BLOB_READERS),
+        # so dispatch is a single dictionary lookup
+        reader = BLOB_READERS.get(content_type)
+        logger.info("Content type: %s", content_type)
+        if reader is None or blob_data is None:
+            return None
         try:
-            loader = BlobDataLoader.get_pandas_loader(content_type)
-            logger.info(f"Content type: {content_type}")
-            logger.info(f"Loader: {loader}")
-            if loader is None:
-                return None
-
-            with BytesIO(blob_data) as data:
-                if loader == "read_xml":
-                    data = data.getvalue().decode("utf-8")
-                elif loader == "read_excel":
-                    df = pd.read_excel(data, sheet_name=None)
-                    logger.info(f"Loaded Excel data: {df}")
-                    return df
-                else:
-                    df = getattr(pd, loader)(data)
-                    logger.info(f"Loaded data: {df}")
-                    return df
+            df = reader(blob_data, columns=columns, filters=filters)
+            logger.info("Loaded data: %s", df)
+            return df
         except Exception as ex:
-            logger.error(f"Failed to load blob to DataFrame - {str(ex)}")
+            logger.error("Failed to load blob to DataFrame - %s", ex)
             return None
 
     @staticmethod
-    def load_blob_content(container_client: ContainerClient, blob_name: str) -> bytes:
+    def read_parquet(
+        blob_data: StorageStreamDownloader,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List] = None,
+    ) -> pd.DataFrame:
+        """
+        Parses the content of a Parquet blob.
+
+        Args:
+            blob_data (StorageStreamDownloader): The download stream of the blob.
+            columns (Optional[List[str]]): The columns to read. If None, all columns are read.
+            filters (Optional[List]): Row filters applied while reading, in pyarrow's DNF format.
+
+        Returns:
+            pd.DataFrame: The parsed Parquet data.
+        """
+        # Reading from a memory map keeps the raw file out of the process heap, and
+        # self_destruct releases each Arrow column as soon as it has been converted
+        table = pq.read_table(
+            pa.BufferReader(BlobDataLoader.map_blob_content(blob_data)),
+            columns=columns,
+            filters=filters,
+            use_threads=True,
+        )
+        return table.to_pandas(
+            split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype
+        )
+
+    @staticmethod
+    def read_csv(data: BinaryIO) -> pd.DataFrame:
         """
-        Load the content of a single blob.
+        Parses CSV content with pyarrow's multithreaded reader.
+
+        Falls back to pandas for dialects that pyarrow's parser rejects.
+
+        Args:
+            data (BinaryIO): A seekable file object containing the CSV content.
+
+        Returns:
+            pd.DataFrame: The parsed CSV data.
+        """
+        try:
+            table = pa_csv.read_csv(
+                data,
+                read_options=pa_csv.ReadOptions(
+                    use_threads=True, block_size=CSV_BLOCK_SIZE
+                ),
+            )
+        except pa.ArrowInvalid as ex:
+            logger.warning("Falling back to pandas CSV parser - %s", ex)
+            data.seek(0)
+            return pd.read_csv(data, dtype_backend=DTYPE_BACKEND)
+        return table.to_pandas(
+            split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype
+        )
+
+    @staticmethod
+    def spool_blob_content(blob_data: StorageStreamDownloader) -> SpooledTemporaryFile:
+        """
+        Stream the content of a blob into a seekable file object.
+
+        The content is kept in memory up to SPOOL_MAX_SIZE bytes and spilled to a temporary file beyond that.
+
+        Args:
+            blob_data (StorageStreamDownloader): The download stream of the blob.
+
+        Returns:
+            SpooledTemporaryFile: A file object positioned at the start of the blob content.
+        """
+        spool = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        blob_data.readinto(spool)
+        spool.seek(0)
+        return spool
+
+    @staticmethod
+    def map_blob_content(blob_data: StorageStreamDownloader) -> mmap.mmap:
+        """
+        Stream the content of a blob to a temporary file and memory-map it read-only.
+
+        The mapping stays valid after the temporary file is closed, and is released once nothing references it.
+
+        Args:
+            blob_data (StorageStreamDownloader): The download stream of the blob.
+
+        Returns:
+            mmap.mmap: A read-only memory map of the blob content.
+        """
+        with TemporaryFile() as tmp:
+            blob_data.readinto(tmp)
+            tmp.flush()
+            return mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def load_blob_content(
+        container_client: ContainerClient, blob_name: str
+    ) -> Optional[StorageStreamDownloader]:
+        """
+        Open a download stream for the content of a single blob.
 
         Args:
             container_client (ContainerClient): The client for the container where the blob is located.
             blob_name (str): The name of the blob to load.
 
         Returns:
-            bytes: The content of the blob.
+            Optional[StorageStreamDownloader]: The download stream of the blob, or None if the download could not be started.
         """
         try:
-            return container_client.download_blob(blob_name).content_as_bytes()
+            return container_client.download_blob(blob_name)
         except Exception as ex:
-            logger.error(f"Failed to load blob '{blob_name}' - {str(ex)}")
-            return b""
+            logger.error("Failed to load blob '%s' - %s", blob_name, ex)
+            return None
+
+
+def _spooled(reader: Callable[[BinaryIO], BlobContent]) -> Callable[..., BlobContent]:
+    """
+    Adapt a reader of file objects to take a blob download stream.
+
+    The content is spooled into a seekable file first, since the download stream cannot be read by pandas directly.
+    Options that only apply to Parquet blobs are ignored.
+
+    Args:
+        reader (Callable[[BinaryIO], BlobContent]): A function parsing a file object.
+
+    Returns:
+        Callable[..., BlobContent]: A function parsing a blob download stream.
+    """
+
+    def read(blob_data: StorageStreamDownloader, **_) -> BlobContent:
+        with BlobDataLoader.spool_blob_content(blob_data) as data:
+            return reader(data)
+
+    return read
+
+
+# The reader behind each pandas loader name, with its options bound once at import time
+_LOADER_READERS: Dict[str, Callable[..., BlobContent]] = {
+    "read_csv": _spooled(BlobDataLoader.read_csv),
+    "read_json": _spooled(partial(pd.read_json, dtype_backend=DTYPE_BACKEND)),
+    "read_excel": _spooled(
+        partial(pd.read_excel, sheet_name=None, dtype_backend=DTYPE_BACKEND)
+    ),
+    "read_parquet": BlobDataLoader.read_parquet,
+    "read_html": _spooled(partial(pd.read_html, dtype_backend=DTYPE_BACKEND)),
+    "read_xml": _spooled(partial(pd.read_xml, dtype_backend=DTYPE_BACKEND)),
+}
+
+# The reader for each supported content type
+BLOB_READERS: Dict[str, Callable[..., BlobContent]] = {
+    content_type: _LOADER_READERS[loader]
+    for content_type, loader in CONTENT_TYPE_MAPPING.items()
+}
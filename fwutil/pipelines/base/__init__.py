@@ -1,2 +1,4 @@
 from .etl_strategy import (DependentETLPipeline, ETLPipeline, ExtractStrategy,
-                           LoadStrategy, TransformStrategy)
+                           LoadStrategy, StreamingETLPipeline,
+                           StreamingExtractStrategy, StreamingLoadStrategy,
+                           TransformStrategy)
@@ -1,6 +1,9 @@
 import logging
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional
 
 import pandas as pd
 
@@ -56,6 +59,55 @@ class LoadStrategy(ABC):
         pass
 
 
+class StreamingExtractStrategy(ExtractStrategy):
+    """
+    Abstract Class to define an interface for an extraction strategy that produces its data in chunks.
+    """
+
+    @abstractmethod
+    def extract_chunks(self, *args, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Perform extraction of data, one chunk at a time.
+
+        Returns:
+            Iterator[pd.DataFrame]: The extracted DataFrame chunks.
+        """
+        pass
+
+    def extract(self, *args, **kwargs) -> pd.DataFrame:
+        """
+        Perform extraction of data as a single DataFrame.
+
+        Returns:
+            pd.DataFrame: The extracted chunks concatenated into one DataFrame.
+        """
+        chunks = list(self.extract_chunks(*args, **kwargs))
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+
+class StreamingLoadStrategy(LoadStrategy):
+    """
+    Abstract Class to define an interface for a load strategy that receives its data in chunks.
+
+    load is called once per chunk, and close once after the last chunk, or with commit set to False
+    if the pipeline fails part way through.
+    """
+
+    @abstractmethod
+    def close(self, commit: bool = True, *args, **kwargs) -> Any:
+        """
+        Finish loading once every chunk has been passed to load.
+
+        Args:
+            commit (bool): Whether to commit the loaded chunks. If False, the partial output is discarded
+                and only the strategy's resources are released.
+
+        Returns:
+            Any: The result of the load.
+        """
+        pass
+
+
 class ETLPipeline:
     """
     A class that represents an ETL (Extract, Transform, Load) strategy. It utilizes
@@ -100,15 +152,21 @@ class ETLPipeline:
         and finally loading the data. The exact behavior at each phase depends on the
         specific strategies provided during the creation of the ETLPipeline instance.
 
+        Only the last extract strategy is run: each extract produces a fresh DataFrame and
+        nothing consumes the earlier ones, so they are skipped rather than extracted and
+        discarded. Transform and load strategies are chained, each receiving the previous
+        strategy's output.
+
         Returns:
             Any: The result of the load phase. The exact type of the return value depends on the specific LoadStrategy used.
         """
-        data = None
-        for strategy in self.extract_strategies:
-            data = strategy.extract()
-        for strategy in self.transform_strategies:
+        extract_strategies, transform_strategies, load_strategies = (
+            self.extract_strategies, self.transform_strategies, self.load_strategies
+        )
+        data = extract_strategies[-1].extract() if extract_strategies else None
+        for strategy in transform_strategies:
             data = strategy.transform(data)
-        for strategy in self.load_strategies:
+        for strategy in load_strategies:
             data = strategy.load(data)
         return data
 
@@ -165,4 +223,106 @@ class DependentETLPipeline:
             data = strategy.transform()  
         for strategy in self.load_strategies:
             data = strategy.load(data)
-        return data
\ No newline at end of file
+        return data
+
+
+class StreamingETLPipeline:
+    """
+    A class that represents an ETL strategy which streams its data through the pipeline in chunks.
+
+    Extraction runs on a background thread and hands chunks to the calling thread through a bounded
+    queue, where each chunk is transformed and loaded. Waiting on the source therefore overlaps with
+    transforming and loading, and at most max_queued_chunks chunks are held in memory at once.
+
+    Attributes:
+        extract_strategies (List[StreamingExtractStrategy]): The strategies producing the chunks, in order.
+        transform_strategies (List[TransformStrategy]): The strategies applied to each chunk.
+        load_strategies (List[StreamingLoadStrategy]): The strategies receiving each transformed chunk.
+        max_queued_chunks (int): The number of extracted chunks that may wait to be transformed.
+    """
+
+    def __init__(
+        self,
+        extract_strategies: List[StreamingExtractStrategy],
+        transform_strategies: List[TransformStrategy],
+        load_strategies: List[StreamingLoadStrategy],
+        logger: Optional[logging.Logger] = None,
+        max_queued_chunks: int = 4,
+        *args,
+        **kwargs
+    ):
+        """
+        The constructor for StreamingETLPipeline class.
+
+        Args:
+            extract_strategies (List[StreamingExtractStrategy]): The strategies to use for the extraction phase.
+            transform_strategies (List[TransformStrategy]): The strategies to use for the transformation phase.
+            load_strategies (List[StreamingLoadStrategy]): The strategies to use for the loading phase.
+            logger (logging.Logger, optional): The logger to use for logging. If None, logging is skipped.
+            max_queued_chunks (int): The number of extracted chunks that may wait to be transformed.
+        """
+        if logger is not None:
+            logger.info("Using extract strategies: {}".format([type(strategy).__name__ for strategy in extract_strategies]))
+            logger.info("Using transform strategies: {}".format([type(strategy).__name__ for strategy in transform_strategies]))
+            logger.info("Using load strategies: {}".format([type(strategy).__name__ for strategy in load_strategies]))
+        self.extract_strategies = extract_strategies
+        self.transform_strategies = transform_strategies
+        self.load_strategies = load_strategies
+        self.max_queued_chunks = max_queued_chunks
+
+    def execute(self, *args, **kwargs):
+        """
+        Executes the ETL process chunk by chunk. Every chunk produced by the extract strategies is passed
+        through the transform strategies and then to each load strategy. Once all chunks have been loaded,
+        the load strategies are closed. If any phase fails, the load strategies are still closed, but
+        without committing their partial output.
+
+        Returns:
+            Any: The result of closing the last load strategy.
+        """
+        end = object()
+        chunks = queue.Queue(maxsize=self.max_queued_chunks)
+        stopped = threading.Event()
+
+        def produce():
+            try:
+                for strategy in self.extract_strategies:
+                    for chunk in strategy.extract_chunks():
+                        if stopped.is_set():
+                            return
+                        chunks.put(chunk)
+            finally:
+                chunks.put(end)
+
+        completed = False
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                producer = executor.submit(produce)
+                try:
+                    while (chunk := chunks.get()) is not end:
+                        for strategy in self.transform_strategies:
+                            chunk = strategy.transform(chunk)
+                        for strategy in self.load_strategies:
+                            strategy.load(chunk)
+                except BaseException:
+                    # Stop the producer and drain the queue so that it is not left blocked on a full queue
+                    stopped.set()
+                    while chunks.get() is not end:
+                        pass
+                    raise
+                # Re-raise any error from the extraction
+                producer.result()
+            completed = True
+        finally:
+            # Close every load strategy even if one of them fails to close
+            result = None
+            errors = []
+            for strategy in self.load_strategies:
+                try:
+                    result = strategy.close(commit=completed)
+                except Exception as e:
+                    errors.append(e)
+            # After a failure, the original error is the one worth raising
+            if completed and errors:
+                raise errors[0]
+        return result
@@ -3,5 +3,6 @@ from .azure_blob_strategies import (
     AzureBlobStorageExcelSheetExtractStrategy,
     AzureBlobStorageExtractStrategy,
     AzureBlobStorageParquetLoadStrategy,
+    AzureBlobStorageParquetStreamLoadStrategy,
 )
 from .date_table_strategy import DateTableTransformStrategy
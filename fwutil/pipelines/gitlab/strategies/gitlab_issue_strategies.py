@@ -1,23 +1,51 @@
 # Here is an implementation that includes the suggested improvements:
 
-from typing import Dict, Optional
-from urllib.parse import urlparse
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 
 import azure_interface as AzureInterface
 import gitlab
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import pipelines.base as PipelineBases
 import pipelines.common as CommonStrategies
 import utils as Utils
 
+logger = Utils.PipelineLogger.get_logger(__name__)
 
-class GitlabIssuesExtractStrategy:
+# A scheme followed by "://" and a non-empty network location, matched case-insensitively. It is
+# run by pyarrow's RE2 engine, so it must stay within the RE2 syntax (no backreferences or lookaround)
+URL_PATTERN = r"^[a-z][a-z0-9+.\-]*://[^\s/?#]+"
+
+# The length of the shortest value URL_PATTERN can match, such as "a://b"
+MIN_URL_LENGTH = 5
+
+
+class GitlabIssuesExtractStrategy(PipelineBases.StreamingExtractStrategy):
     """
     A class that represents a strategy for extracting data from Gitlab Issues.
+
+    The issues can be extracted as a single DataFrame with extract, or one project at a time with
+    extract_chunks for use in a StreamingETLPipeline.
     """
 
     conn: gitlab.Gitlab
 
+    # Number of projects whose issues are fetched at the same time
+    MAX_CONCURRENT_REQUESTS: int = 16
+
+    # Issues fetched per request; the GitLab API allows at most 100
+    ISSUES_PER_PAGE: int = 100
+
+    # Number of times a rate-limited request is retried, and the initial delay in seconds between attempts
+    MAX_RETRIES: int = 5
+    RETRY_BACKOFF: float = 1.0
+
     def __init__(self, gl_conn: gitlab.Gitlab):
         """
         Initialize the GitlabIssuesExtractStrategy class.
@@ -25,21 +53,86 @@ class GitlabIssuesExtractStrategy:
         Args:
             gl_conn (gitlab.Gitlab): A Gitlab connection object.
         """
-        self.logger = Utils.PipelineLogger.get_logger(__name__)
-        self.logger.info("Initializing Gitlab Issues Extract Strategy...")
+        logger.info("Initializing Gitlab Issues Extract Strategy...")
         self.gl_conn = gl_conn
 
     def extract(self) -> pd.DataFrame:
+        """
+        Extract the issues of every project visible to the Gitlab connection.
+
+        Projects are fetched concurrently on a thread pool, since the work is dominated by waiting on the API.
+
+        Returns:
+            pd.DataFrame: A DataFrame with one row per issue.
+        """
         projects = self.gl_conn.projects.list(get_all=True)  # get all projects
-        all_issues = []
-        for project in projects:
-            issues = project.issues.list(
-                get_all=True
-            )  # get all issues for each project
-            all_issues.extend([issue.attributes for issue in issues])
+        if not projects:
+            return pd.DataFrame()
+        max_workers = min(len(projects), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            issues_by_project = executor.map(self.extract_project_issues, projects)
+            all_issues = list(itertools.chain.from_iterable(issues_by_project))
+        # pd.DataFrame takes the union of the keys of all issues, and keeps nested attributes as dicts
+        # for GitlabIssuesTransformStrategy to melt. pa.Table.from_pylist would infer the schema from the
+        # first issue only and turn nested attributes into struct columns that are never melted.
         df = pd.DataFrame(all_issues)
         return df
 
+    def extract_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Extract the issues of every project visible to the Gitlab connection, one project at a time.
+
+        Projects are fetched concurrently on a thread pool, but only MAX_CONCURRENT_REQUESTS projects are
+        fetched ahead of the consumer, so the issues of at most that many projects are held in memory.
+
+        Returns:
+            Iterator[pd.DataFrame]: A DataFrame with one row per issue for each project that has issues.
+        """
+        projects = self.gl_conn.projects.list(get_all=True)  # get all projects
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            pending = deque()
+            for project in projects:
+                pending.append(executor.submit(self.extract_project_issues, project))
+                if len(pending) < self.MAX_CONCURRENT_REQUESTS:
+                    continue
+                issues = pending.popleft().result()
+                if issues:
+                    yield pd.DataFrame(issues)
+            while pending:
+                issues = pending.popleft().result()
+                if issues:
+                    yield pd.DataFrame(issues)
+
+    def extract_project_issues(self, project) -> List[Dict]:
+        """
+        Extract the attributes of all issues of a single project.
+
+        Requests rejected by the API rate limit (HTTP 429) are retried with exponential backoff.
+
+        Args:
+            project: The Gitlab project whose issues are extracted.
+
+        Returns:
+            List[Dict]: The attributes of each issue of the project.
+        """
+        delay = self.RETRY_BACKOFF
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                issues = project.issues.list(
+                    get_all=True, per_page=self.ISSUES_PER_PAGE
+                )  # get all issues for the project
+                return [issue.attributes for issue in issues]
+            except gitlab.exceptions.GitlabError as e:
+                if e.response_code != 429 or attempt == self.MAX_RETRIES:
+                    raise
+                logger.warning(
+                    "Rate limited while listing issues of project %s, retrying in %s seconds",
+                    project.id,
+                    delay,
+                )
+                time.sleep(delay)
+                delay *= 2
+
 
 class GitlabIssuesTransformStrategy:
     """
@@ -49,9 +142,11 @@ class GitlabIssuesTransformStrategy:
     and overrides the `transform` method to include functionality specific to this project.
     """
 
+    # Issue attributes returned by python-gitlab that only hold URLs (directly, or nested as with _links)
+    KNOWN_URL_KEYS = frozenset({"web_url", "avatar_url", "_links"})
+
     def __init__(self):
-        self.logger = Utils.PipelineLogger.get_logger(__name__)
-        self.logger.info("Initializing Gitlab Issues Transform Strategy...")
+        logger.info("Initializing Gitlab Issues Transform Strategy...")
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -66,9 +161,15 @@ class GitlabIssuesTransformStrategy:
         Raises:
             Exception: If there's any error during the transformation process.
         """
-        self.logger.info("Transforming transaction data...")
-        self.logger.info(df)
+        logger.info("Transforming transaction data...")
+        # Rendering the whole frame is expensive, so skip it unless debug output is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(df)
+        # Drop the attributes known to hold URLs by name before exploding, so the nested _links dicts are
+        # never expanded and the URL scan below runs on a narrower frame
+        df = df.drop(columns=[col for col in df.columns if col in self.KNOWN_URL_KEYS])
         df = Utils.DataFrameTransformer().explode_df(df)
+        # Catch the remaining URL columns, such as the web_url of a nested author or milestone
         df = self.remove_url_columns(df)
         return df
 
@@ -76,21 +177,31 @@ class GitlabIssuesTransformStrategy:
         """
         This function takes a dataframe and removes any columns containing URLs.
 
+        A value counts as a URL when it has a scheme and a network location, such as "https://gitlab.com".
+        Only object and string columns are scanned, since numeric, boolean and datetime values can never
+        hold a URL. Each column is converted to an Arrow string array and matched by pyarrow's RE2
+        engine, which scans every value in linear time without backtracking.
+
         Args:
             df (pd.DataFrame): Input dataframe.
 
         Returns:
             pd.DataFrame: Output dataframe with URL columns removed.
         """
-
-        def is_url(val):
-            """Check if a value is a URL by trying to parse it."""
-            try:
-                result = urlparse(str(val))
-                return all([result.scheme, result.netloc])
-            except ValueError:
-                return False
-
-        cols_to_drop = [col for col in df.columns if df[col].apply(is_url).any()]
+        cols_to_drop = []
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            values = df[col].dropna()
+            if values.empty:
+                continue
+            if values.dtype == object:
+                # Object columns may hold dicts, lists or numbers, so they are matched on their string form
+                values = values.astype(str)
+            strings = pa.array(values, from_pandas=True)
+            if pc.max(pc.utf8_length(strings)).as_py() < MIN_URL_LENGTH:
+                continue
+            if pc.any(
+                pc.match_substring_regex(strings, URL_PATTERN, ignore_case=True)
+            ).as_py():
+                cols_to_drop.append(col)
         df = df.drop(columns=cols_to_drop)
         return df
@@ -1,9 +1,107 @@
 import logging
+import re
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from .logger import PipelineLogger
 
+# The word separators in column names: '_', and the '.' joining a melted column to its keys
+COLUMN_NAME_SEPARATOR_RE = re.compile(r"[._]")
+
+
+def _has_dict(values: pd.Series) -> bool:
+    """
+    Check whether a Series holds any dictionaries.
+
+    The type of the values is first inferred in C, so a column holding only strings, numbers or missing
+    values is ruled out without visiting its values in Python. Columns with mixed types are then scanned
+    until the first dictionary, checking exact types, which is cheaper than an isinstance check through
+    Series.apply that builds a boolean Series over every row.
+
+    Args:
+        values (pd.Series): The Series to check.
+
+    Returns:
+        bool: True if any value in the Series is a dict.
+    """
+    # Dictionaries are only ever inferred as "mixed" or, next to integers, "mixed-integer"
+    if not pd.api.types.infer_dtype(values, skipna=True).startswith("mixed"):
+        return False
+    return any(type(value) is dict for value in values.to_numpy())
+
+
+def _is_empty_or_zero_arrow(values: pa.Array) -> bool:
+    """
+    Check whether an Arrow array holds only nulls, or only zeros apart from nulls.
+
+    Args:
+        values (pa.Array): The Arrow array to check.
+
+    Returns:
+        bool: True if every value is null, or every non-null value is zero or false.
+    """
+    if values.null_count == len(values):
+        return True
+    if pa.types.is_boolean(values.type):
+        return not pc.any(values).as_py()
+    if (
+        pa.types.is_integer(values.type)
+        or pa.types.is_floating(values.type)
+        or pa.types.is_decimal(values.type)
+    ):
+        return not pc.any(pc.not_equal(values, 0)).as_py()
+    # Other types, such as strings and timestamps, never compare equal to zero
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _to_pascal_case(name: str) -> str:
+    """
+    Convert a column name to PascalCase by capitalizing its '.' and '_' separated words.
+
+    The same column names recur across the frames of a pipeline, so the conversions are cached.
+
+    Args:
+        name (str): The column name to convert.
+
+    Returns:
+        str: The column name in PascalCase.
+
+    Example:
+        >>> _to_pascal_case("author.web_url")
+        'AuthorWebUrl'
+    """
+    return "".join(word.capitalize() for word in COLUMN_NAME_SEPARATOR_RE.split(name))
+
+
+def _expand_dicts(values: pd.Series) -> pd.DataFrame:
+    """
+    Expand a Series of dictionaries into a DataFrame with one column per key.
+
+    The DataFrame is built from the dictionaries in a single construction rather than creating a
+    Series for every row. Values that are not dictionaries are expanded as a Series would expand them,
+    so None becomes an empty row and a list becomes one column per position.
+
+    Args:
+        values (pd.Series): The Series to expand.
+
+    Returns:
+        pd.DataFrame: The expanded DataFrame, with the same index as the Series.
+    """
+    records = [
+        (
+            value
+            if type(value) is dict
+            else {} if value is None else pd.Series(value).to_dict()
+        )
+        for value in values.to_numpy()
+    ]
+    return pd.DataFrame.from_records(records, index=values.index)
+
 
 class DataFrameTransformer:
     """
@@ -41,18 +139,29 @@ class DataFrameTransformer:
             Exception: If an error occurs during the DataFrame explosion process.
         """
         try:
-            self.logger.info(pd.__version__)
-            self.logger.info(df.dtypes)
+            # Building and formatting the dtypes of a wide frame is not free, so they are only logged when
+            # debug output is enabled
+            log_dtypes = self.logger.isEnabledFor(logging.DEBUG)
+            if log_dtypes:
+                self.logger.debug("pandas version: %s", pd.__version__)
+                self.logger.debug("Input dtypes:\n%s", df.dtypes)
             df = self.melt_object_columns(df)
-            self.logger.info(df.dtypes)
+            if log_dtypes:
+                self.logger.debug("Melted dtypes:\n%s", df.dtypes)
             df = self.remove_empty_or_zero_columns(df)
-            self.logger.info(df.dtypes)
+            if log_dtypes:
+                self.logger.debug("Non-empty dtypes:\n%s", df.dtypes)
             df = self.format_column_names(df)
-            self.logger.info(df.dtypes)
+            if log_dtypes:
+                self.logger.debug("Formatted dtypes:\n%s", df.dtypes)
             df = self.rename_duplicate_columns(df)
-            self.logger.info(df.columns)
+            if log_dtypes:
+                self.logger.debug("Columns: %s", df.columns.tolist())
+            # convert_dtypes converts the frame column by column, so consolidating its blocks first would
+            # only add a full copy
             df = df.convert_dtypes(dtype_backend="pyarrow")
-            self.logger.info(df.dtypes)
+            if log_dtypes:
+                self.logger.debug("Output dtypes:\n%s", df.dtypes)
             return df
         except Exception as e:
             self.logger.error(f"Failed to explode DataFrame: {e}")
@@ -69,7 +178,8 @@ class DataFrameTransformer:
             df (pd.DataFrame): The DataFrame whose object columns will be melted.
 
         Returns:
-            pd.DataFrame: The DataFrame with melted object columns.
+            pd.DataFrame: The DataFrame with melted object columns. The input DataFrame is never modified;
+            it is returned as-is when it has no dictionary values to melt.
 
         Raises:
             Exception: If an error occurs during the melting process.
@@ -81,36 +191,73 @@ class DataFrameTransformer:
             # Log the identified object columns
             self.logger.info(f"Identified object columns: {object_columns.tolist()}")
 
-            # Create a copy of the original DataFrame to prevent modifying the original
-            df_copy = df.copy()
-
-            # Iterate over object columns
-            for col in object_columns:
-                # Check if the column contains any dictionary-like objects
-                contains_dicts = df_copy[col].apply(isinstance, args=(dict,)).any()
-                if contains_dicts:
-                    # Expand dictionary-like objects into separate columns
-                    expanded_col = df_copy[col].apply(pd.Series)
-
-                    # Prefix the column names with the original column name
-                    expanded_col.columns = [f"{col}.{c}" for c in expanded_col.columns]
-
-                    # Log the column being melted and the resulting column names
-                    self.logger.info(
-                        f'Melting column "{col}" into columns: {expanded_col.columns.tolist()}'
-                    )
-
-                    # Drop the original column from the DataFrame
-                    df_copy.drop(col, axis=1, inplace=True)
-
-                    # Concatenate the expanded columns to the DataFrame
-                    df_copy = pd.concat([df_copy, expanded_col], axis=1)
-                    
-            if any(df_copy[col].apply(isinstance, args=(dict,)).any() for col in df_copy.columns):
-                return self.melt_object_columns(df_copy)
-            
-            return df_copy
-        
+            # Only object columns can hold dicts, so a frame without any has nothing to melt
+            if object_columns.empty:
+                return df
+
+            # The columns are kept as a list and joined into a DataFrame in a single concat at the end, rather
+            # than copying the whole DataFrame once per melted column. Each pass only checks the columns that
+            # were expanded by the previous one, since the other columns are already known to hold no dicts
+            columns = [values for _, values in df.items()]
+            to_check = [
+                position
+                for position, values in enumerate(columns)
+                if values.dtype == object
+            ]
+            melted_any = False
+
+            while to_check:
+                melted_positions = set()
+                expanded_columns = []
+
+                for position in to_check:
+                    values = columns[position]
+                    col = values.name
+                    # Check if the column contains any dictionary-like objects
+                    if values.dtype == object and _has_dict(values):
+                        # Expand dictionary-like objects into separate columns
+                        expanded_col = _expand_dicts(values)
+
+                        # Prefix the column names with the original column name
+                        expanded_col.columns = [
+                            f"{col}.{c}" for c in expanded_col.columns
+                        ]
+
+                        # Log the column being melted and the resulting column names
+                        self.logger.info(
+                            f'Melting column "{col}" into columns: {expanded_col.columns.tolist()}'
+                        )
+
+                        melted_positions.add(position)
+                        expanded_columns.extend(
+                            values for _, values in expanded_col.items()
+                        )
+
+                if not melted_positions:
+                    break
+
+                # Replace the melted columns with their expansions, which are the only columns checked next
+                melted_any = True
+                columns = [
+                    values
+                    for position, values in enumerate(columns)
+                    if position not in melted_positions
+                ]
+                to_check = list(
+                    range(len(columns), len(columns) + len(expanded_columns))
+                )
+                columns.extend(expanded_columns)
+
+            if melted_any:
+                # Dicts without any keys expand to no columns, so every column may have been melted away
+                df = (
+                    pd.concat(columns, axis=1)
+                    if columns
+                    else pd.DataFrame(index=df.index)
+                )
+
+            return df
+
         except Exception as e:
             self.logger.error(f"Failed to melt object columns: {e}")
             raise
@@ -132,10 +279,48 @@ class DataFrameTransformer:
         """
         try:
             self.logger.info("Remove Empty Columns for DF")
-            empty_columns = df.columns[df.isna().all()]
-
-            # Identify columns that contain only zeros
-            zero_columns = df.columns[(df == 0).all()]
+            # Columns backed by NumPy numbers or booleans are checked on their arrays directly, without building
+            # boolean frames. NaN compares as non-zero, so a float column is only scanned for NaNs when it
+            # starts with one
+            is_numpy_numeric = np.array(
+                [
+                    isinstance(dtype, np.dtype) and dtype.kind in "biufc"
+                    for dtype in df.dtypes
+                ],
+                dtype=bool,
+            )
+            is_empty_or_zero = np.zeros(len(df.columns), dtype=bool)
+            for position in np.flatnonzero(is_numpy_numeric):
+                values = df.iloc[:, position].to_numpy()
+                if not (values != 0).any():
+                    is_empty_or_zero[position] = True
+                elif values.dtype.kind in "fc" and np.isnan(values[0]):
+                    is_empty_or_zero[position] = np.isnan(values).all()
+
+            # Arrow-backed columns are checked with Arrow compute kernels: the null count is kept with the
+            # array, and nulls are skipped when comparing to zero, as pandas does for these dtypes
+            is_arrow = np.array(
+                [isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes], dtype=bool
+            )
+            for position in np.flatnonzero(is_arrow):
+                is_empty_or_zero[position] = _is_empty_or_zero_arrow(
+                    pa.array(df.iloc[:, position].array)
+                )
+
+            # Identify the other columns that contain only NaN values or only zeros. Only the columns whose
+            # first value is missing or zero can qualify, so the full scans are limited to those
+            other = df.iloc[:, ~(is_numpy_numeric | is_arrow)]
+            first_row = other.iloc[:1]
+            maybe_empty = other.iloc[
+                :, np.flatnonzero(first_row.isna().all().to_numpy())
+            ]
+            maybe_zero = other.iloc[
+                :, np.flatnonzero((first_row == 0).all().to_numpy())
+            ]
+            empty_columns = maybe_empty.columns[maybe_empty.isna().all()].union(
+                df.columns[is_empty_or_zero]
+            )
+            zero_columns = maybe_zero.columns[(maybe_zero == 0).all()]
 
             # Combine the empty columns and zero columns
             columns_to_drop = empty_columns.union(zero_columns)
@@ -150,7 +335,7 @@ class DataFrameTransformer:
         except Exception as e:
             self.logger.error(f"Failed to remove empty or zero columns: {e}")
             raise
-        
+
     def remove_empty_or_zero_rows(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Remove empty or zero rows from the DataFrame.
@@ -166,26 +351,36 @@ class DataFrameTransformer:
         Raises:
             Exception: If an error occurs during the removal process.
         """
-        logger = Utils.PipelineLogger.get_logger(__name__)
         try:
-            logger.info("Remove Empty Rows for DF")
-
-            # Identify rows that contain only NaN values
-            empty_rows = df.index[df.isna().all(axis=1)]
-
-            # Identify rows that contain only zeros
-            zero_rows = df.index[(df == 0).all(axis=1)]
-
-            # Combine the empty rows and zero rows
-            rows_to_drop = empty_rows.union(zero_rows)
+            self.logger.info("Remove Empty Rows for DF")
+
+            if not df.columns.empty and all(
+                isinstance(dtype, np.dtype) and dtype.kind in "biufc"
+                for dtype in df.dtypes
+            ):
+                # A frame of NumPy numbers or booleans is checked on a single array, without building boolean
+                # frames. NaN compares as non-zero, so only the rows starting with NaN are checked for NaNs
+                values = df.to_numpy()
+                is_empty_or_zero = ~(values != 0).any(axis=1)
+                if values.dtype.kind in "fc":
+                    starts_with_nan = np.flatnonzero(np.isnan(values[:, 0]))
+                    is_empty_or_zero[starts_with_nan] = np.isnan(
+                        values[starts_with_nan]
+                    ).all(axis=1)
+            else:
+                # Identify rows that contain only NaN values or only zeros
+                is_empty_or_zero = (
+                    df.isna().all(axis=1) | (df == 0).all(axis=1)
+                ).to_numpy()
 
             # Drop the empty and zero rows from the DataFrame
-            df = df.drop(rows_to_drop)
-            logger.info(f"Dropped empty or zero rows: {rows_to_drop.tolist()}")
+            rows_to_drop = df.index[is_empty_or_zero]
+            df = df[~is_empty_or_zero]
+            self.logger.info("Dropped empty or zero rows: %s", rows_to_drop.tolist())
 
             return df
         except Exception as e:
-            logger.error(f"Failed to remove empty or zero rows: {e}")
+            self.logger.error(f"Failed to remove empty or zero rows: {e}")
             raise
 
     def format_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -204,27 +399,8 @@ class DataFrameTransformer:
             Exception: If an error occurs during the formatting process.
         """
         try:
-            # Define a function to convert a string to PascalCase
-            def to_pascal_case(s):
-                return "".join(word.capitalize() for word in s.split("_"))
-
-            # Get the current column names
-            old_column_names = df.columns
-
-            # Create a dictionary to store the mappings from old to new column names
-            column_name_mapping = {}
-
-            # Iterate through the old column names and create the new formatted column names
-            for old_name in old_column_names:
-                # Replace '.' with '_' in the column name
-                new_name = old_name.replace(".", "_")
-                # Convert to PascalCase
-                new_name = to_pascal_case(new_name)
-                # Add the mapping to the dictionary
-                column_name_mapping[old_name] = new_name
-
-            # Rename the columns using the mapping dictionary
-            df.rename(columns=column_name_mapping, inplace=True)
+            # Convert each column name to PascalCase, treating '.' and '_' alike as word separators
+            df.columns = df.columns.map(_to_pascal_case)
 
             return df
         except Exception as e:
@@ -246,27 +422,22 @@ class DataFrameTransformer:
             Exception: If an error occurs during the renaming process.
         """
         try:
-            # Create a dictionary to store the count of each column name
-            col_count = {}
-            # Create a list to store the new column names
-            new_columns = []
-
-            # Iterate over the columns in the DataFrame
-            for col in df.columns:
-                # If the column name is already in the dictionary, increment the count
-                if col in col_count:
-                    col_count[col] += 1
-                    # Append the count to the column name to make it unique
-                    new_col = f"{col}_{col_count[col]}"
-                else:
-                    # Initialize the count for the column name in the dictionary
-                    col_count[col] = 0
-                    new_col = col
-                # Add the new column name to the list of new columns
-                new_columns.append(new_col)
-
-            # Assign the new column names to the DataFrame
-            df.columns = new_columns
+            # Most frames have no duplicate columns, in which case there is nothing to rename
+            if not df.columns.has_duplicates:
+                return df
+
+            # Number the occurrences of each column name, starting from 0 for the first occurrence
+            counts = (
+                pd.Series(df.columns)
+                .groupby(df.columns, dropna=False, sort=False)
+                .cumcount()
+            )
+
+            # Append the count to every occurrence after the first to make it unique
+            df.columns = [
+                col if count == 0 else f"{col}_{count}"
+                for col, count in zip(df.columns, counts)
+            ]
 
             return df
         except Exception as e:
@@ -2,6 +2,7 @@ import logging
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from typing import Any, Dict, List, Optional
 
@@ -15,19 +16,32 @@ class JupyterDisplayHandler(logging.Handler):
 
     This handler extends the logging.Handler class and overrides the emit method to
     display the log message in a Jupyter notebook using the display function.
+
+    Attributes:
+        preview_rows (int): The maximum number of rows rendered for a DataFrame in a log message.
     """
 
+    preview_rows: int = 50
+
     def emit(self, record: logging.LogRecord) -> None:
         """
         Write the log message formatted for the Jupyter notebook.
 
+        DataFrames passed as log arguments are rendered as HTML tables of at most preview_rows rows.
+
         Args:
             record (LogRecord): LogRecord object containing the log information.
         """
         log_entry = self.format(record)
-        for arg in record.args:
-            if isinstance(arg, pd.DataFrame):
-                log_entry = log_entry.replace(str(arg), arg.to_html())
+        # Most records have no arguments, and only DataFrames appearing in the message are rendered
+        if record.args:
+            for arg in record.args:
+                if isinstance(arg, pd.DataFrame):
+                    text = str(arg)
+                    if text in log_entry:
+                        log_entry = log_entry.replace(
+                            text, arg.to_html(max_rows=self.preview_rows)
+                        )
         display(HTML(log_entry))
 
 
@@ -106,6 +120,12 @@ class PipelineLogger:
         logger.addHandler(console_handler)
         logger.addHandler(file_handler)
 
+        # Log the location of the log file. The root logger keeps its WARNING level, so the message goes
+        # through a logger whose level is set here, and reaches the new handlers by propagation
+        PipelineLogger.get_logger(__name__).info(
+            "Log file is located at: %s", os.path.abspath(PipelineLogger.log_file)
+        )
+
     @staticmethod
     def get_logger(
         name: str,
@@ -117,6 +137,9 @@ class PipelineLogger:
         """
         Gets a logger with the given name.
 
+        Loggers are configured once per name and format, and their level is only set when it changes, so
+        getting the same logger again, for example from every new instance of a class, does no further work.
+
         Args:
             name (str): The name of the logger.
             level (int, optional): The log level of the logger.
@@ -127,11 +150,33 @@ class PipelineLogger:
         Returns:
             logger (logging.Logger): A logger with the given configurations
         """
-        logger: logging.Logger = logging.getLogger(name)
-        if level is not None:
+        if level is None:
+            level = PipelineLogger.log_level
+        logger = PipelineLogger._get_configured_logger(name, format)
+        # Setting a level clears the cached levels of every logger, so it is skipped when unchanged
+        if logger.level != level:
             logger.setLevel(level)
-        else:
-            logger.setLevel(PipelineLogger.log_level)
+
+        if handlers is not None:
+            for handler in handlers:
+                logger.addHandler(handler)
+
+        return logger
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_configured_logger(name: str, format: Optional[str]) -> logging.Logger:
+        """
+        Gets the logger with the given name, configured with the given format.
+
+        Args:
+            name (str): The name of the logger.
+            format (str, optional): A custom format for the logger
+
+        Returns:
+            logger (logging.Logger): A logger with the given configurations
+        """
+        logger: logging.Logger = logging.getLogger(name)
 
         if not logger.handlers:
             if format is None:
@@ -140,12 +185,4 @@ class PipelineLogger:
             for handler in logger.handlers:
                 handler.setFormatter(formatter)
 
-        if handlers is not None:
-            for handler in handlers:
-                logger.addHandler(handler)
-
-        # Log the location of the log file
-        log_file_abs_path = os.path.abspath(PipelineLogger.log_file)
-        logger.info(f"Log file is located at: {log_file_abs_path}")
-
         return logger